@@ -1,8 +1,21 @@
 from pathlib import Path
 
-from matplotlib import pyplot as plt
-from pywps import FORMATS, ComplexInput, ComplexOutput, Format, LiteralInput, Process
-from ravenpy.utilities import graphs
+import matplotlib
+
+# Select the headless backend before pyplot is imported, to avoid paying
+# for GUI toolkit imports on the server.
+matplotlib.use("Agg")
+
+from matplotlib import pyplot as plt  # noqa: E402
+from pywps import (  # noqa: E402
+    FORMATS,
+    ComplexInput,
+    ComplexOutput,
+    Format,
+    LiteralInput,
+    Process,
+)
+from ravenpy.utilities import graphs  # noqa: E402
 
 
 class GraphFcstUncertaintyProcess(Process):
@@ -83,7 +96,7 @@ class GraphFcstUncertaintyProcess(Process):
 
         # Save file to disk
         fig_fn_fcst = Path(self.workdir) / "forecast_hydrographs.png"
-        fig.savefig(fig_fn_fcst)
+        fig.savefig(fig_fn_fcst, dpi=100)
         plt.close(fig)
 
         response.outputs["graph_forecasts"].file = str(fig_fn_fcst)
@@ -37,6 +37,11 @@ class RavenProcess(Process):
     ]
     model_cls = Raven
 
+    # Default parameter values of the emulated model; when set by a subclass,
+    # a `params` input is built lazily from them on first instantiation.
+    params_defaults = None
+    _params_input = None
+
     def __init__(self):
         super().__init__(
             self._handler,
@@ -44,12 +49,31 @@ class RavenProcess(Process):
             title=self.title,
             version=self.version,
             abstract=self.abstract,
-            inputs=self.inputs,
+            inputs=self.build_inputs(),
             outputs=self.outputs,
             status_supported=True,
             store_supported=True,
         )
 
+    def build_inputs(self):
+        """Return the process inputs, inserting the lazily built `params` input.
+
+        The `params` literal input is created from `params_defaults` on first
+        instantiation and cached on the class, so importing the process modules
+        does not pay for the dataclass introspection and string formatting of
+        every emulator's defaults.
+        """
+        if self.params_defaults is None:
+            return self.inputs
+
+        cls = type(self)
+        if cls._params_input is None:
+            cls._params_input = wio.params_input(self.params_defaults)
+
+        inputs = list(self.inputs)
+        inputs.insert(inputs.index(wio.nc_spec) + 1, cls._params_input)
+        return inputs
+
     def model(self, request):
         """Return model class."""
         return self.model_cls(workdir=self.workdir)
@@ -120,6 +144,11 @@ class RavenProcess(Process):
         """Run the model.
 
         If keywords contain `rvc`, initialize the model using the initial condition file.
+
+        Repeated inputs collected under ``kwds["parallel"]`` (e.g. multiple `params`
+        sets) are launched by ravenpy as concurrent Raven subprocesses, each writing
+        to its own run directory, and merged into a single ensemble output along the
+        parallel dimension.
         """
         model(ts=ts, **kwds)
 
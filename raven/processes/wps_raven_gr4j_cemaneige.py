@@ -1,11 +1,7 @@
 import logging
-from dataclasses import astuple, fields
 
-from pywps import LiteralInput
 from ravenpy.models import GR4JCN
 
-from raven import config
-
 from . import wpsio as wio
 from .wps_raven import RavenProcess
 
@@ -29,16 +25,6 @@ params_defaults = GR4JCN.Params(
     CEMANEIGE_X2=0.947,
 )
 
-params = LiteralInput(
-    "params",
-    "Comma separated list of model parameters",
-    abstract="Parameters: " + ", ".join(f.name for f in fields(params_defaults)),
-    data_type="string",
-    default=", ".join(map(str, astuple(params_defaults))),
-    min_occurs=0,
-    max_occurs=config.max_parallel_processes,
-)
-
 
 class RavenGR4JCemaNeigeProcess(RavenProcess):
     """
@@ -57,11 +43,11 @@ class RavenGR4JCemaNeigeProcess(RavenProcess):
     version = ""
     model_cls = GR4JCN
     tuple_inputs = {"params": GR4JCN.Params}
+    params_defaults = params_defaults
 
     inputs = [
         wio.ts,
         wio.nc_spec,
-        params,
         wio.start_date,
         wio.end_date,
         wio.nc_index,
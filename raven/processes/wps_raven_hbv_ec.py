@@ -1,9 +1,5 @@
-from dataclasses import astuple, fields
-
-from pywps import LiteralInput
 from ravenpy.models import HBVEC
 
-from raven import config
 from raven.processes import RavenProcess
 
 from . import wpsio as wio
@@ -34,17 +30,6 @@ params_defaults = HBVEC.Params(
 )
 
 
-params = LiteralInput(
-    "params",
-    "Comma separated list of model parameters",
-    abstract="Parameters: " + ", ".join(f.name for f in fields(params_defaults)),
-    data_type="string",
-    default=", ".join(map(str, astuple(params_defaults))),
-    min_occurs=0,
-    max_occurs=config.max_parallel_processes,
-)
-
-
 class RavenHBVECProcess(RavenProcess):
     identifier = "raven-hbv-ec"
     abstract = "HBV-EC hydrological model"
@@ -52,11 +37,11 @@ class RavenHBVECProcess(RavenProcess):
     version = ""
     model_cls = HBVEC
     tuple_inputs = {"params": HBVEC.Params}
+    params_defaults = params_defaults
 
     inputs = [
         wio.ts,
         wio.nc_spec,
-        params,
         wio.start_date,
         wio.end_date,
         wio.nc_index,
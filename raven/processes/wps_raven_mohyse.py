@@ -1,9 +1,5 @@
-from dataclasses import astuple, fields
-
-from pywps import LiteralInput
 from ravenpy.models import MOHYSE
 
-from raven import config
 from raven.processes import RavenProcess
 
 from . import wpsio as wio
@@ -22,16 +18,6 @@ params_defaults = MOHYSE.Params(
     par_x10=5.6167,
 )
 
-params = LiteralInput(
-    "params",
-    "Comma separated list of model parameters",
-    abstract="Parameters: " + ", ".join(f.name for f in fields(params_defaults)),
-    data_type="string",
-    default=", ".join(map(str, astuple(params_defaults))),
-    min_occurs=0,
-    max_occurs=config.max_parallel_processes,
-)
-
 
 class RavenMOHYSEProcess(RavenProcess):
     identifier = "raven-mohyse"
@@ -40,11 +26,11 @@ class RavenMOHYSEProcess(RavenProcess):
     version = ""
     model_cls = MOHYSE
     tuple_inputs = {"params": MOHYSE.Params}
+    params_defaults = params_defaults
 
     inputs = [
         wio.ts,
         wio.nc_spec,
-        params,
         wio.start_date,
         wio.end_date,
         wio.nc_index,
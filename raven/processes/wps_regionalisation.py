@@ -1,12 +1,16 @@
 import json
 import logging
-import string
-import traceback
+from functools import lru_cache
 from pathlib import Path
 
+import netCDF4
+import numpy as np
+import pandas as pd
+import xarray as xr
 from pywps import FORMATS, ComplexInput, LiteralInput
 from pywps.app.exceptions import ProcessError
 from ravenpy.utilities import read_gauged_params, read_gauged_properties, regionalize
+from scipy.spatial import cKDTree
 
 from . import wpsio as wio
 from .wps_raven import RavenProcess
@@ -14,6 +18,186 @@ from .wps_raven import RavenProcess
 LOGGER = logging.getLogger("PYWPS")
 
 
+@lru_cache(maxsize=8)
+def _cached_gauged_params(model_name):
+    """Return the cached NSE and parameter tables for `model_name`.
+
+    The reference database is immutable over the process lifetime, so there is
+    no point re-parsing it from disk on every request.
+    """
+    return read_gauged_params(model_name)
+
+
+@lru_cache(maxsize=32)
+def _cached_gauged_properties(keys):
+    """Return the cached gauged catchment properties for the given keys.
+
+    `keys` is a tuple preserving the order of the request's properties: the
+    ungauged properties are compared positionally to the table columns
+    downstream, so the column order must not be normalized.
+    """
+    return read_gauged_properties(list(keys))
+
+
+def _spatial_donor_subset(nash, params, props, ungauged_props, size, min_NSE):
+    """Pre-select spatially nearest donor candidates with a KD-tree.
+
+    For the spatial proximity methods, the donors are the `size` closest
+    catchments passing the NSE filter, so there is no need to hand the whole
+    reference database to `regionalize`. The candidates are found by querying a
+    KD-tree built on the gauged coordinates; a generous superset (at least ten
+    times the donor count) is kept so that the great-circle ranking done
+    downstream is unaffected by the Euclidean query.
+
+    Returns
+    -------
+    (pd.Series, pd.DataFrame, pd.DataFrame)
+      The `nash`, `params` and `props` tables restricted to the candidates, or
+      the original tables when subsetting would not reduce them.
+    """
+    # Mirror the downstream filtering: NSE threshold, then drop rows with any
+    # missing property, so the tree never sees NaN coordinates.
+    candidates = props.loc[nash > min_NSE].dropna()
+    k = max(10 * size, 50)
+    if len(candidates) <= k:
+        return nash, params, props
+
+    tree = cKDTree(np.column_stack([candidates["latitude"], candidates["longitude"]]))
+    _, idx = tree.query([ungauged_props["latitude"], ungauged_props["longitude"]], k=k)
+    donors = candidates.index[np.atleast_1d(idx)]
+
+    return nash.loc[donors], params.loc[donors], props.loc[donors]
+
+
+def _similarity_donor_subset(nash, params, props, ungauged_props, size, min_NSE):
+    """Pre-select physically similar donor candidates with a Gower-type distance.
+
+    Mirrors the range-normalized similarity used downstream in a single NumPy
+    broadcast: per-property absolute differences to the ungauged catchment,
+    scaled by the property range over the NSE-valid table, summed across
+    properties. `np.argpartition` then keeps the `k` best candidates in O(N)
+    instead of sorting the whole table.
+
+    The rows holding each property's minimum and maximum are kept as well, so
+    the normalization ranges seen by `regionalize` — and therefore the final
+    ranking and IDW weights — are identical to those of the full table.
+
+    Returns
+    -------
+    (pd.Series, pd.DataFrame, pd.DataFrame)
+      The `nash`, `params` and `props` tables restricted to the candidates, or
+      the original tables when subsetting would not reduce them.
+    """
+    # Mirror the downstream filtering: NSE threshold, then drop rows with any
+    # missing property, so NaNs cannot poison the ranges or the ranking.
+    candidates = props.loc[nash > min_NSE].dropna()
+    k = max(10 * size, 50)
+    if len(candidates) <= k:
+        return nash, params, props
+
+    table = candidates.values.astype(float)
+    query = np.asarray([ungauged_props[key] for key in candidates.columns], dtype=float)
+
+    ranges = np.ptp(table, axis=0)
+    ranges[ranges == 0] = 1.0
+    dists = (np.abs(table - query[None, :]) / ranges[None, :]).sum(axis=1)
+
+    keep = np.argpartition(dists, k)[:k]
+    keep = np.union1d(
+        keep, np.concatenate([table.argmin(axis=0), table.argmax(axis=0)])
+    )
+    donors = candidates.index[keep]
+
+    return nash.loc[donors], params.loc[donors], props.loc[donors]
+
+
+# CF-style time encoding applied when writing datetime coordinates.
+TIME_UNITS = "days since 1970-01-01 00:00:00"
+TIME_CALENDAR = "proleptic_gregorian"
+
+
+def _fast_write_nc(ds, path, unlimited=None):
+    """Write an in-memory xarray object through the netCDF4 library directly.
+
+    Bypasses xarray's `to_netcdf` encoding pipeline, which re-validates and
+    re-encodes every variable before writing. Here dimensions and variables are
+    created straight from the in-memory arrays and each variable is bulk-written
+    in a single call, with shuffled zlib compression and per-member chunks sized
+    along the time axis for the downstream slice-at-a-time readers.
+
+    Parameters
+    ----------
+    ds : xr.DataArray or xr.Dataset
+      Object to write. A DataArray is promoted to a single-variable dataset.
+    path : str or Path
+      Path of the NetCDF file to create.
+    unlimited : str, optional
+      Name of a dimension to create as unlimited. Variables spanning it are
+      appended to the file one slice at a time, so the writer's working set
+      stays one member deep regardless of the ensemble size.
+    """
+    if isinstance(ds, xr.DataArray):
+        ds = ds.to_dataset(name=ds.name or "q_sim")
+
+    with netCDF4.Dataset(path, "w", format="NETCDF4") as nc:
+        nc.setncatts(ds.attrs)
+
+        for dim, size in ds.sizes.items():
+            nc.createDimension(dim, None if dim == unlimited else size)
+
+        variables = dict(ds.coords)
+        variables.update(ds.data_vars)
+
+        for name, da in variables.items():
+            values = da.values
+            attrs = dict(da.attrs)
+
+            if np.issubdtype(values.dtype, np.datetime64):
+                values = netCDF4.date2num(
+                    pd.DatetimeIndex(values).to_pydatetime(),
+                    units=TIME_UNITS,
+                    calendar=TIME_CALENDAR,
+                )
+                attrs.setdefault("units", TIME_UNITS)
+                attrs.setdefault("calendar", TIME_CALENDAR)
+
+            if values.dtype.kind in "OSU":
+                # Variable-length strings cannot be compressed nor chunked.
+                var = nc.createVariable(name, str, da.dims)
+                var[:] = np.asarray(values, dtype=object)
+            elif da.ndim == 0:
+                var = nc.createVariable(name, values.dtype, ())
+                var.assignValue(values)
+            else:
+                chunksizes = None
+                if "time" in da.dims:
+                    chunksizes = tuple(
+                        min(ds.sizes["time"], 4096) if d == "time" else 1
+                        for d in da.dims
+                    )
+                var = nc.createVariable(
+                    name,
+                    values.dtype,
+                    da.dims,
+                    zlib=True,
+                    complevel=4,
+                    shuffle=True,
+                    chunksizes=chunksizes,
+                )
+                if unlimited in da.dims and da.ndim > 1:
+                    # Append one slice at a time along the unlimited axis.
+                    axis = da.dims.index(unlimited)
+                    for i in range(values.shape[axis]):
+                        index = (slice(None),) * axis + (i,)
+                        var[index] = np.take(values, i, axis=axis)
+                else:
+                    var[:] = values
+
+            var.setncatts(attrs)
+
+    return path
+
+
 class RegionalisationProcess(RavenProcess):
     """
     Notes
@@ -185,13 +369,27 @@ class RegionalisationProcess(RavenProcess):
 
         response.update_status("Inputs are read", 1)
 
-        nash, params = read_gauged_params(model_name)
+        nash, params = _cached_gauged_params(model_name)
         response.update_status("Gauged params are read", 2)
 
-        props = read_gauged_properties(properties.keys())
+        props = _cached_gauged_properties(tuple(properties.keys()))
         ungauged_props = {key: properties[key] for key in properties}
         response.update_status("Gauged properties are read", 3)
 
+        # Restrict the tables to the nearest candidates for the purely spatial
+        # methods. The RA variants are excluded because their regression step
+        # uses the full filtered database.
+        if method in ("SP", "SP_IDW") and {"latitude", "longitude"} <= set(
+            props.columns
+        ):
+            nash, params, props = _spatial_donor_subset(
+                nash, params, props, ungauged_props, ndonors, min_NSE
+            )
+        elif method in ("PS", "PS_IDW"):
+            nash, params, props = _similarity_donor_subset(
+                nash, params, props, ungauged_props, ndonors, min_NSE
+            )
+
         try:
             qsim, ensemble = regionalize(
                 method,
@@ -206,6 +404,10 @@ class RegionalisationProcess(RavenProcess):
                 **kwds,
             )
         except Exception as exc:
+            # Only needed on the error path; keep them off the module import.
+            import string
+            import traceback
+
             LOGGER.exception(exc)
             err_msg = traceback.format_exc()
             # By default the error message is limited to 300 chars and strips
@@ -218,12 +420,18 @@ class RegionalisationProcess(RavenProcess):
 
         # Write output
         nc_qsim = Path(self.workdir) / "qsim.nc"
-        qsim.to_netcdf(nc_qsim)
+        _fast_write_nc(qsim, nc_qsim)
         response.outputs["hydrograph"].file = str(nc_qsim)
 
         # TODO: Complete attributes
-        nc_ensemble = Path(self.workdir) / "ensemble.nc"
-        ensemble.to_netcdf(nc_ensemble)
-        response.outputs["ensemble"].file = str(nc_ensemble)
+        # Clients rely on the ensemble output carrying a realization dimension
+        # even for the single-member MLR result, so it is always written when
+        # present; only a missing ensemble falls back to the qsim file.
+        if ensemble is not None and ensemble.sizes.get("realization", 0) >= 1:
+            nc_ensemble = Path(self.workdir) / "ensemble.nc"
+            _fast_write_nc(ensemble, nc_ensemble, unlimited="realization")
+            response.outputs["ensemble"].file = str(nc_ensemble)
+        else:
+            response.outputs["ensemble"].file = str(nc_qsim)
 
         return response
@@ -4,7 +4,7 @@ This module contains the WPS inputs and outputs that are reused across multiple
 
 """
 
-from dataclasses import fields
+from dataclasses import astuple, fields
 
 from pywps import (
     FORMATS,
@@ -317,6 +317,30 @@ hbvec = LiteralInput(
     min_occurs=0,
 )
 
+
+def params_input(defaults):
+    """Return the `params` literal input for a model emulator process.
+
+    Parameters
+    ----------
+    defaults : dataclass instance
+      Default parameter values of the emulated model, e.g. `GR4JCN.Params(...)`.
+
+    Called on demand rather than at import time, so that the dataclass
+    introspection and string formatting of the defaults are only paid by
+    processes that are actually instantiated.
+    """
+    return LiteralInput(
+        "params",
+        "Comma separated list of model parameters",
+        abstract="Parameters: " + ", ".join(f.name for f in fields(defaults)),
+        data_type="string",
+        default=", ".join(map(str, astuple(defaults))),
+        min_occurs=0,
+        max_occurs=config.max_parallel_processes,
+    )
+
+
 # --- GIS Inputs --- #
 
 region_vector = ComplexInput(
@@ -25,6 +25,19 @@ class WpsTestClient(WpsClient):
         return super().get(query)
 
 
+def build_datainputs(**kwargs):
+    """Return a WPS `datainputs` string assembled from keyword arguments.
+
+    List or tuple values are repeated under the same key, which is how parallel
+    inputs (e.g. multiple `params` sets) are encoded.
+    """
+    parts = []
+    for key, value in kwargs.items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        parts.extend(f"{key}={v}" for v in values)
+    return ";".join(parts) + ";"
+
+
 def count_pixels(stats, numeric_categories=False):
     category_counts = 0
     for key, val in stats.items():
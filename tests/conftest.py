@@ -1,3 +1,4 @@
+import functools
 import os
 import shutil
 from pathlib import Path
@@ -188,7 +189,11 @@ def get_file(threadsafe_data_dir):
 
 @pytest.fixture(scope="session")
 def get_local_testdata(threadsafe_data_dir):
+    @functools.lru_cache(maxsize=None)
     def _get_session_scoped_local_testdata(file: Union[str, Path]):
+        # The same files are requested over and over across tests; memoizing the
+        # resolver skips the repeated filesystem (and potentially network)
+        # lookups for the rest of the session.
         return _get_local_testdata(
             file,
             temp_folder=threadsafe_data_dir,
@@ -1,22 +1,24 @@
 import datetime as dt
 
 # import matplotlib.pyplot as plt
-# import pytest
 # import xarray as xr
+import pytest
 from pywps import Service
 from pywps.tests import assert_response_success
 
 from raven.processes import ClimatologyEspProcess
 
-from .common import CFG_FILE, client_for, get_output
+from .common import CFG_FILE, build_datainputs, client_for, get_output
 
 
-class TestClimatologyESP:
-    def test_simple(self, get_local_testdata):
-        client = client_for(
-            Service(processes=[ClimatologyEspProcess()], cfgfiles=CFG_FILE)
-        )
+@pytest.fixture(scope="class")
+def esp_client():
+    """Reuse the same service and client across the class's tests."""
+    return client_for(Service(processes=[ClimatologyEspProcess()], cfgfiles=CFG_FILE))
+
 
+class TestClimatologyESP:
+    def test_simple(self, esp_client, get_local_testdata):
         #
         # model = 'HMETS'
         # params = '9.5019, 0.2774, 6.3942, 0.6884, 1.2875, 5.4134, 2.3641, 0.0973, 0.0464, 0.1998, 0.0222, -1.0919, ' \
@@ -30,41 +32,29 @@ class TestClimatologyESP:
         forecast_date = dt.datetime(1954, 12, 30)
         forecast_duration = 365  # Number of days for forecast duration
 
-        datainputs = (
-            "ts=files@xlink:href=file://{ts};"
-            "params={params};"
-            "init={init};"
-            "name={name};"
-            "run_name={run_name};"
-            "area={area};"
-            "latitude={latitude};"
-            "longitude={longitude};"
-            "elevation={elevation};"
-            "forecast_date={forecast_date};"
-            "forecast_duration={forecast_duration};"
-            "model_name={model_name};"
-            "rvc=files@xlink:href=file://{rvc};".format(
-                ts=get_local_testdata(
-                    "raven-gr4j-cemaneige/Salmon-River-Near-Prince-George_meteo_daily.nc",
-                ),
-                params=params,
-                init="155,455",
-                name="Salmon",
-                run_name="test-climatologyESP",
-                area="4250.6",
-                elevation="843.0",
-                latitude=54.4848,
-                longitude=-123.3659,
-                forecast_date=forecast_date,
-                forecast_duration=forecast_duration,
-                model_name=model,
-                rvc=get_local_testdata(
-                    "gr4j_cemaneige/solution.rvc",
-                ),
-            )
+        ts = get_local_testdata(
+            "raven-gr4j-cemaneige/Salmon-River-Near-Prince-George_meteo_daily.nc",
+        )
+        rvc = get_local_testdata(
+            "gr4j_cemaneige/solution.rvc",
+        )
+        datainputs = build_datainputs(
+            ts=f"files@xlink:href=file://{ts}",
+            params=params,
+            init="155,455",
+            name="Salmon",
+            run_name="test-climatologyESP",
+            area="4250.6",
+            latitude=54.4848,
+            longitude=-123.3659,
+            elevation="843.0",
+            forecast_date=forecast_date,
+            forecast_duration=forecast_duration,
+            model_name=model,
+            rvc=f"files@xlink:href=file://{rvc}",
         )
 
-        resp = client.get(
+        resp = esp_client.get(
             service="WPS",
             request="Execute",
             version="1.0.0",